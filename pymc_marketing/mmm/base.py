@@ -22,7 +22,10 @@ from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import FunctionTransformer
 from xarray import DataArray, Dataset
 
-from pymc_marketing.mmm.budget_optimizer import budget_allocator
+from pymc_marketing.mmm.budget_optimizer import (
+    budget_allocator,
+    budget_allocator_batch,
+)
 from pymc_marketing.mmm.transformers import michaelis_menten
 from pymc_marketing.mmm.utils import (
     estimate_menten_parameters,
@@ -866,6 +869,9 @@ class BaseMMM(ModelBuilder):
         budget_bounds: Optional[Dict[str, Tuple[float, float]]] = None,
         *,
         parameters: Dict[str, Tuple[float, float]],
+        solver: str = "SLSQP",
+        ftol: float = 1e-6,
+        maxiter: int = 200,
     ) -> pd.DataFrame:
         """
         Experimental: Optimize the allocation of a given total budget across multiple
@@ -888,7 +894,15 @@ class BaseMMM(ModelBuilder):
             parameters for each channel based on the method used.
         budget_bounds : Dict, optional
             An optional dictionary defining the minimum and maximum budget for each channel.
-            If not provided, the budget for each channel is constrained between 0 and its L value.
+            If not provided, the budget for each channel is constrained between 0 and the smaller
+            of its L value and the total budget.
+        solver : str, optional
+            The optimization algorithm to use. It can be either 'SLSQP' or 'projected_gradient'.
+            By default 'SLSQP'.
+        ftol : float, optional
+            Precision goal for the value of the objective in the stopping criterion, by default 1e-6.
+        maxiter : int, optional
+            Maximum number of iterations of the optimization algorithm, by default 200.
 
         Returns
         -------
@@ -921,6 +935,93 @@ class BaseMMM(ModelBuilder):
             channels=list(self.channel_columns),
             parameters=parameters,
             budget_ranges=budget_bounds,
+            solver=solver,
+            ftol=ftol,
+            maxiter=maxiter,
+        )
+
+    def optimize_channel_budget_for_maximum_contribution_batch(
+        self,
+        method: str,
+        total_budgets: List[float],
+        budget_bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+        *,
+        parameters: Dict[str, Tuple[float, float]],
+        ftol: float = 1e-6,
+        maxiter: int = 200,
+    ) -> pd.DataFrame:
+        """
+        Experimental: Optimize the allocation of several total budgets across multiple
+        channels to maximize the expected contribution.
+
+        This is the batched counterpart of `optimize_channel_budget_for_maximum_contribution`,
+        meant for sweeps over the total budget. The objective is built once and all the total
+        budgets are optimized simultaneously with projected gradient descent, instead of
+        running one optimization per total budget.
+
+        Parameters
+        ----------
+        method : str, required
+            The method used to fit the contribution & spent non-linear relationship.
+            It can be either 'sigmoid' or 'michaelis-menten'.
+        total_budgets : List of float, required
+            The total budgets to be distributed across channels.
+        budget_bounds : Dict, optional
+            An optional dictionary defining the minimum and maximum budget for each channel.
+            If not provided, the budget for each channel is constrained between 0 and the smaller
+            of its L value and the total budget.
+        parameters : Dict, required
+            A dictionary where keys are channel names and values are tuples (L, k) representing the
+            parameters for each channel based on the method used.
+        ftol : float, optional
+            Precision goal for the value of the objective in the stopping criterion, by default 1e-6.
+        maxiter : int, optional
+            Maximum number of iterations of the optimization algorithm, by default 200.
+
+        Returns
+        -------
+        DataFrame
+            A pandas DataFrame containing the allocated budget and contribution information,
+            indexed by the total budget and then by channel, with a 'total' row for each total
+            budget. Selecting one total budget gives the output of
+            `optimize_channel_budget_for_maximum_contribution`.
+
+        Raises
+        ------
+        ValueError
+            If any of the required parameters are not provided or have an incorrect type.
+        """
+        if not isinstance(budget_bounds, (dict, type(None))):
+            raise TypeError("`budget_ranges` should be a dictionary or None.")
+
+        if np.ndim(total_budgets) != 1:
+            raise ValueError(
+                "The 'total_budgets' parameter must be a one-dimensional list of budgets."
+            )
+
+        if not all(
+            isinstance(total_budget, (int, float, np.number))
+            for total_budget in total_budgets
+        ):
+            raise ValueError(
+                "The 'total_budgets' parameter must be a list of integers or floats."
+            )
+
+        if not parameters:
+            raise ValueError(
+                "The 'parameters' argument (keyword-only) must be provided and non-empty."
+            )
+
+        warnings.warn("This budget allocator method is experimental", UserWarning)
+
+        return budget_allocator_batch(
+            method=method,
+            total_budgets=total_budgets,
+            channels=list(self.channel_columns),
+            parameters=parameters,
+            budget_ranges=budget_bounds,
+            ftol=ftol,
+            maxiter=maxiter,
         )
 
     def compute_channel_curve_optimization_parameters_original_scale(
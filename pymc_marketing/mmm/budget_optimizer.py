@@ -1,14 +1,50 @@
 """Budget optimization module."""
 
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
-from pandas import DataFrame
+import numpy.typing as npt
+from pandas import DataFrame, Index, MultiIndex
 from scipy.optimize import minimize
 
 from pymc_marketing.mmm.transformers import michaelis_menten
 from pymc_marketing.mmm.utils import sigmoid_saturation
 
+_RESPONSE_FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "michaelis-menten": michaelis_menten,
+    "sigmoid": sigmoid_saturation,
+}
+
+
+def _get_response_function(
+    method: str, response_functions: Dict[str, Callable[..., Any]]
+) -> Callable[..., Any]:
+    """Look up the function associated with `method` in `response_functions`."""
+    try:
+        return response_functions[method]
+    except KeyError:
+        raise ValueError(
+            "`method` must be either 'michaelis-menten' or 'sigmoid'."
+        ) from None
+
+
+def _stack_parameters(
+    channels: List[str],
+    parameters: Dict[str, Tuple[float, float]],
+) -> Tuple[npt.NDArray[np.float64], ...]:
+    """
+    Stack the parameters of each channel into one array per parameter.
+
+    The arrays are ordered like `channels`, so that the response functions and their
+    derivatives can be evaluated on all channels at once. Without channels, both
+    arrays are empty.
+    """
+    return tuple(
+        np.array([parameters[channel] for channel in channels], dtype=np.float64)
+        .reshape(len(channels), 2)
+        .T
+    )
+
 
 def calculate_expected_contribution(
     method: str,
@@ -51,24 +87,19 @@ def calculate_expected_contribution(
         If the specified `method` is not recognized.
     """
 
-    total_expected_contribution = 0.0
-    contributions = {}
-
-    for channel, channe_budget in budget.items():
-        if method == "michaelis-menten":
-            L, k = parameters[channel]
-            contributions[channel] = michaelis_menten(channe_budget, L, k)
-
-        elif method == "sigmoid":
-            alpha, lam = parameters[channel]
-            contributions[channel] = sigmoid_saturation(channe_budget, alpha, lam)
+    response = _get_response_function(method, _RESPONSE_FUNCTIONS)
 
-        else:
-            raise ValueError("`method` must be either 'michaelis-menten' or 'sigmoid'.")
-
-        total_expected_contribution += contributions[channel]
+    channels = list(budget)
+    channel_contributions = response(
+        np.array([budget[channel] for channel in channels], dtype=np.float64),
+        *_stack_parameters(channels, parameters),
+    )
 
-    contributions["total"] = total_expected_contribution
+    contributions = {
+        channel: float(contribution)
+        for channel, contribution in zip(channels, channel_contributions)
+    }
+    contributions["total"] = float(np.sum(channel_contributions))
 
     return contributions
 
@@ -101,21 +132,369 @@ def objective_distribution(
         Negative of the total expected contribution for the given budget distribution.
     """
 
-    sum_contributions = 0.0
+    response = _get_response_function(method, _RESPONSE_FUNCTIONS)
 
-    for channel, budget in zip(channels, x):
-        if method == "michaelis-menten":
-            L, k = parameters[channel]
-            sum_contributions += michaelis_menten(budget, L, k)
+    sum_contributions = np.sum(
+        response(
+            np.asarray(x, dtype=np.float64), *_stack_parameters(channels, parameters)
+        )
+    )
+
+    return -1 * float(sum_contributions)
 
-        elif method == "sigmoid":
-            alpha, lam = parameters[channel]
-            sum_contributions += sigmoid_saturation(budget, alpha, lam)
 
-        else:
-            raise ValueError("`method` must be either 'michaelis-menten' or 'sigmoid'.")
+def _michaelis_menten_with_derivative(x, alpha, lam):
+    """
+    Michaelis-Menten function and its derivative with respect to the spend `x`.
 
-    return -1 * sum_contributions
+    Both share the denominator, so it is only computed once.
+    """
+    denominator = lam + x
+    return alpha * x / denominator, alpha * lam / denominator**2
+
+
+def _sigmoid_saturation_with_derivative(x, alpha, lam):
+    """
+    Sigmoid saturation function and its derivative with respect to the spend `x`.
+
+    Both share the exponential, so it is only computed once. The parameters are not
+    validated here, as `_build_objective` validates them once.
+    """
+    exp_x = np.exp(-lam * x)
+    return (
+        (alpha - alpha * exp_x) / (1 + exp_x),
+        2 * alpha * lam * exp_x / (1 + exp_x) ** 2,
+    )
+
+
+_RESPONSE_FUNCTIONS_WITH_DERIVATIVE: Dict[str, Callable[..., Any]] = {
+    "michaelis-menten": _michaelis_menten_with_derivative,
+    "sigmoid": _sigmoid_saturation_with_derivative,
+}
+
+
+def _build_objective(
+    method: str,
+    channels: List[str],
+    parameters: Dict[str, Tuple[float, float]],
+) -> Callable[[npt.ArrayLike], Tuple[float, npt.NDArray[np.float64]]]:
+    """
+    Build the objective minimized by the optimizer, along with its analytic gradient.
+
+    The response function and the parameters of each channel are resolved once, so
+    that each evaluation of the objective during the optimization only computes the
+    contributions, instead of dispatching on `method` and looking up the parameters
+    of every channel on each call. The parameters are stacked across channels, so the
+    contributions of all channels are computed in a single vectorized call.
+
+    The gradient is computed in closed form, together with the objective, as both
+    share most of their intermediate terms. This avoids approximating it with
+    finite differences, which costs one extra objective evaluation per channel on
+    every iteration.
+
+    Parameters
+    ----------
+    method : str
+        The model to use for contribution estimation. Choose from 'michaelis-menten' or 'sigmoid'.
+    channels : List of str
+        The List of channels for which the budget is being optimized.
+    parameters : Dict
+        Model-specific parameters for each channel as described in `calculate_expected_contribution`.
+
+    Returns
+    -------
+    Callable
+        Function mapping a budget distribution to the negative of its total expected contribution
+        and the gradient of the latter. Budget distributions can be stacked along leading axes,
+        in which case the objective is computed for each of them.
+    """
+    response_with_derivative = _get_response_function(
+        method, _RESPONSE_FUNCTIONS_WITH_DERIVATIVE
+    )
+    channel_parameters = _stack_parameters(channels, parameters)
+    # Validate the parameters once, so that the objective does not check them again
+    # on every evaluation
+    alpha, lam = channel_parameters
+    if method == "sigmoid" and (np.any(alpha <= 0) or np.any(lam <= 0)):
+        raise ValueError("alpha and lam must be greater than 0")
+
+    def objective(x: npt.ArrayLike) -> Tuple[Any, npt.NDArray[np.float64]]:
+        contributions, derivatives = response_with_derivative(
+            np.asarray(x, dtype=np.float64), *channel_parameters
+        )
+        return -1 * np.sum(contributions, axis=-1), -1 * derivatives
+
+    return objective
+
+
+def _clip(x, lower, upper):
+    """`np.clip` through the ufuncs directly, which is cheaper on small arrays."""
+    return np.minimum(np.maximum(x, lower), upper)
+
+
+def _project_onto_capped_simplex(
+    y: npt.NDArray[np.float64],
+    lower: npt.NDArray[np.float64],
+    upper: npt.NDArray[np.float64],
+    total: npt.ArrayLike,
+) -> npt.NDArray[np.float64]:
+    """
+    Euclidean projection of `y` onto the budgets within bounds that add up to `total`.
+
+    The projection is ``clip(y - tau, lower, upper)`` for the shift ``tau`` that
+    makes the budgets add up to `total`. The sum is piecewise linear and
+    non-increasing in ``tau`` with breakpoints at ``y - upper``, where a channel
+    leaves its upper bound, and ``y - lower``, where it reaches its lower bound.
+    After sorting the breakpoints, the sum at each of them follows from a cumulative
+    sum of the slopes, which gives the interval containing ``tau``. ``tau`` is then
+    found from the sum and the slope on that interval, which takes O(N log N)
+    operations overall.
+
+    If `total` cannot be reached within the bounds, the budgets are projected
+    onto the closest reachable total instead.
+
+    `y` can have leading batch dimensions, in which case each budget distribution
+    along the last axis is projected onto the budgets adding up to the matching
+    entry of `total`. `lower` and `upper` broadcast against `y`. The batch dimensions
+    are flattened and the breakpoints are gathered with plain indexing, so that a
+    single budget distribution is projected without the overhead of broadcasting.
+    """
+    batch_shape, n = y.shape[:-1], y.shape[-1]
+    y = y.reshape(-1, n)
+    lower, upper = (
+        np.broadcast_to(bound, (*batch_shape, n)).reshape(-1, n)
+        if np.ndim(bound) > 1
+        else bound
+        for bound in (lower, upper)
+    )
+    total = np.asarray(total, dtype=np.float64)
+    if total.shape != batch_shape:
+        total = np.broadcast_to(total, batch_shape)
+    upper_sum = np.add.reduce(upper, axis=-1)[..., None]
+    total = _clip(
+        total.reshape(-1, 1), np.add.reduce(lower, axis=-1)[..., None], upper_sum
+    )
+
+    breakpoints = np.concatenate((y - upper, y - lower), axis=-1)
+    order = breakpoints.argsort(axis=-1)
+    rows = np.arange(len(breakpoints))[:, None]
+    breakpoints = breakpoints[rows, order]
+    # Number of channels strictly within their bounds after each breakpoint, which
+    # is the opposite of the slope of the sum until the next breakpoint.
+    free_channels = (2 * (order < n) - 1).cumsum(axis=-1)
+    sums = np.empty_like(breakpoints)
+    sums[:, 0] = 0
+    (free_channels[:, :-1] * (breakpoints[:, 1:] - breakpoints[:, :-1])).cumsum(
+        axis=-1, out=sums[:, 1:]
+    )
+    np.subtract(upper_sum, sums, out=sums)
+
+    # Last breakpoint where the budgets still add up to at least the total. When
+    # no channel is free after it, the interval is empty and the sum is the total.
+    low = (sums[:, 1:] > total).sum(axis=-1, keepdims=True)
+    tau = breakpoints[rows, low] + (sums[rows, low] - total) / np.maximum(
+        free_channels[rows, low], 1
+    )
+
+    return _clip(y - tau, lower, upper).reshape(*batch_shape, n)
+
+
+def _sufficient_decrease(x, value, grad, trial, trial_value, step):
+    """
+    Whether the projected gradient step from `x` to `trial` decreases the objective enough.
+
+    The objective at `trial` must lie below its quadratic model around `x` with curvature
+    ``1 / step``, unless the step size has become negligible. The budget distributions
+    can be stacked along leading axes, in which case one decision is returned for each.
+    """
+    difference = trial - x
+    return (
+        trial_value
+        <= value
+        + (grad * difference).sum(axis=-1)
+        + (difference * difference).sum(axis=-1) / (2 * step)
+    ) | (step < np.finfo(np.float64).eps)
+
+
+def _has_converged(value, candidate_value, ftol):
+    """Whether the relative decrease of the objective from `value` is below `ftol`."""
+    return value - candidate_value <= ftol * np.maximum(
+        np.maximum(np.abs(value), np.abs(candidate_value)), 1.0
+    )
+
+
+def _projected_gradient_descent(
+    objective: Callable[[npt.ArrayLike], Tuple[Any, npt.NDArray[np.float64]]],
+    x0: npt.NDArray[np.float64],
+    lower: npt.NDArray[np.float64],
+    upper: npt.NDArray[np.float64],
+    total: npt.ArrayLike,
+    ftol: float = 1e-6,
+    maxiter: int = 200,
+) -> npt.NDArray[np.float64]:
+    """
+    Minimize `objective` over the budgets within bounds that add up to `total`.
+
+    `objective` returns both the value to minimize and its gradient, as built by
+    `_build_objective`. Each iteration takes a gradient step and projects it back
+    onto the feasible set with `_project_onto_capped_simplex`. The step size is
+    chosen by backtracking until the step gives a sufficient decrease of the
+    objective, and it is allowed to grow again on the next iteration. The objective
+    being minimized here is the negative of a sum of concave response curves, so the
+    iterates converge to the global optimum.
+
+    The iterations stop when the relative decrease of the objective is below `ftol`
+    or after `maxiter` iterations.
+
+    `x0` can have leading batch dimensions, in which case the problems are solved
+    simultaneously by `_batched_projected_gradient_descent`. Both share the step
+    acceptance and stopping rules.
+    """
+    if x0.ndim > 1:
+        return _batched_projected_gradient_descent(
+            objective, x0, lower, upper, total, ftol=ftol, maxiter=maxiter
+        )
+
+    x = _project_onto_capped_simplex(x0, lower, upper, total)
+    value, grad = objective(x)
+    step = max(float(np.sum(upper - lower)), 1.0)
+
+    for _ in range(maxiter):
+        while True:
+            candidate = _project_onto_capped_simplex(
+                x - step * grad, lower, upper, total
+            )
+            candidate_value, candidate_grad = objective(candidate)
+            if _sufficient_decrease(x, value, grad, candidate, candidate_value, step):
+                break
+            step /= 2
+
+        converged = _has_converged(value, candidate_value, ftol)
+        x, value, grad = candidate, candidate_value, candidate_grad
+        if converged:
+            break
+        step *= 2
+
+    return x
+
+
+def _batched_projected_gradient_descent(
+    objective: Callable[[npt.ArrayLike], Tuple[Any, npt.NDArray[np.float64]]],
+    x0: npt.NDArray[np.float64],
+    lower: npt.NDArray[np.float64],
+    upper: npt.NDArray[np.float64],
+    total: npt.ArrayLike,
+    ftol: float = 1e-6,
+    maxiter: int = 200,
+) -> npt.NDArray[np.float64]:
+    """
+    Projected gradient descent for the problems defined by each budget distribution along the last axis of `x0`.
+
+    See `_projected_gradient_descent`. Each problem keeps its own step size, and stops
+    being updated once it has converged.
+    """
+    batch_shape = x0.shape[:-1]
+    x = _project_onto_capped_simplex(x0, lower, upper, total)
+    value, grad = objective(x)
+    step = np.broadcast_to(
+        np.maximum(np.sum(upper - lower, axis=-1), 1.0), batch_shape
+    ).astype(np.float64)
+    active = np.ones(batch_shape, dtype=bool)
+
+    for _ in range(maxiter):
+        candidate, candidate_value, candidate_grad = x, value, grad
+        pending = active.copy()
+        while np.any(pending):
+            trial = _project_onto_capped_simplex(
+                x - step[..., None] * grad, lower, upper, total
+            )
+            trial_value, trial_grad = objective(trial)
+            accepted = pending & _sufficient_decrease(
+                x, value, grad, trial, trial_value, step
+            )
+            candidate = np.where(accepted[..., None], trial, candidate)
+            candidate_value = np.where(accepted, trial_value, candidate_value)
+            candidate_grad = np.where(accepted[..., None], trial_grad, candidate_grad)
+            pending &= ~accepted
+            step = np.where(pending, step / 2, step)
+
+        converged = _has_converged(value, candidate_value, ftol)
+        x, value, grad = candidate, candidate_value, candidate_grad
+        active &= ~converged
+        if not np.any(active):
+            break
+        step = np.where(active, step * 2, step)
+
+    return x
+
+
+def _budget_bounds(
+    budget_ranges: Optional[Dict[str, Tuple[float, float]]],
+    parameters: Dict[str, Tuple[float, float]],
+    channels: List[str],
+    total: npt.ArrayLike,
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Lower and upper bounds of the budget of each channel.
+
+    If `budget_ranges` is not provided, the budget for each channel is constrained between
+    0 and the smaller of its L value and the total budget. `total` can be an array of total
+    budgets, in which case the default bounds are stacked along the first axis.
+    """
+    if budget_ranges is None:
+        upper = np.minimum(
+            np.asarray(total, dtype=np.float64)[..., None],
+            np.array(
+                [parameters[channel][0] for channel in channels], dtype=np.float64
+            ),
+        )
+        return np.zeros_like(upper), upper
+
+    lower, upper = (
+        np.array([budget_ranges[channel] for channel in channels], dtype=np.float64)
+        .reshape(len(channels), 2)
+        .T
+    )
+    return lower, upper
+
+
+def _initial_guess(
+    objective: Callable[[npt.ArrayLike], Tuple[Any, npt.NDArray[np.float64]]],
+    lower: npt.NDArray[np.float64],
+    upper: npt.NDArray[np.float64],
+    total: npt.ArrayLike,
+) -> npt.NDArray[np.float64]:
+    """
+    Starting point for the optimization, based on the marginal contribution of each channel.
+
+    The total budget is split with weights given by the softmax of the marginal
+    contributions at the equal split, so that channels whose contribution grows faster
+    start with a larger share of the budget. The temperature of the softmax is three
+    times the standard deviation of the marginal contributions across channels, which
+    leans towards these channels while keeping the starting point close to the equal
+    split. The result is projected onto the budgets within bounds that add up to `total`.
+
+    `total` can be an array of total budgets, in which case one starting point is
+    returned for each of them, stacked along the first axis.
+    """
+    total = np.asarray(total, dtype=np.float64)
+    n = np.shape(lower)[-1]
+    equal_split = np.repeat(total[..., None] / n, n, axis=-1)
+    _, gradient = objective(equal_split)
+
+    marginal_contributions = -1 * gradient
+    temperature = 3 * np.std(marginal_contributions, axis=-1, keepdims=True)
+    temperature = np.where(temperature > 0, temperature, 1.0)
+    weights = np.exp(
+        (
+            marginal_contributions
+            - np.max(marginal_contributions, axis=-1, keepdims=True)
+        )
+        / temperature
+    )
+    weights /= np.sum(weights, axis=-1, keepdims=True)
+
+    return _project_onto_capped_simplex(total[..., None] * weights, lower, upper, total)
 
 
 def optimize_budget_distribution(
@@ -124,6 +503,9 @@ def optimize_budget_distribution(
     budget_ranges: Optional[Dict[str, Tuple[float, float]]],
     parameters: Dict[str, Tuple[float, float]],
     channels: List[str],
+    solver: str = "SLSQP",
+    ftol: float = 1e-6,
+    maxiter: int = 200,
 ) -> Dict[str, float]:
     """
     Optimize the budget allocation across channels to maximize total contribution.
@@ -142,49 +524,157 @@ def optimize_budget_distribution(
     The SLSQP method is particularly suited for this kind of problem as it can handle
     both equality and inequality constraints.
 
+    Alternatively, the contributions being concave in the budget, the optimum can be reached
+    with projected gradient descent, which only needs the objective, its gradient and a cheap
+    projection onto the budgets satisfying both constraints at each iteration.
+
     Parameters
     ----------
     total_budget : int
         The total budget to be distributed across channels.
     budget_ranges : Dict or None
         An optional dictionary defining the minimum and maximum budget for each channel.
-        If not provided, the budget for each channel is constrained between 0 and its L value.
+        If not provided, the budget for each channel is constrained between 0 and the smaller
+        of its L value and the total budget.
     parameters : Dict
         Michaelis-Menten parameters for each channel as described in `calculate_expected_contribution`.
     channels : list of str
         The list of channels for which the budget is being optimized.
+    solver : str, optional
+        The optimization algorithm to use. Choose from 'SLSQP' or 'projected_gradient'.
+        By default 'SLSQP'.
+    ftol : float, optional
+        Precision goal for the value of the objective in the stopping criterion, by default 1e-6.
+    maxiter : int, optional
+        Maximum number of iterations, by default 200.
 
     Returns
     -------
     Dict
         A dictionary with channels as keys and the optimal budget for each channel as values.
+
+    Raises
+    ------
+    ValueError
+        If the specified `solver` is not recognized.
     """
 
     # Check if budget_ranges is the correct type
     if not isinstance(budget_ranges, (dict, type(None))):
         raise TypeError("`budget_ranges` should be a dictionary or None.")
 
-    if budget_ranges is None:
-        budget_ranges = {
-            channel: (0, min(total_budget, parameters[channel][0]))
-            for channel in channels
+    lower, upper = _budget_bounds(budget_ranges, parameters, channels, total_budget)
+    bounds = list(zip(lower, upper))
+
+    objective = _build_objective(method, channels, parameters)
+    initial_guess = _initial_guess(objective, lower, upper, total_budget)
+
+    if solver == "SLSQP":
+        # The budget constraint is linear, so its Jacobian is constant. Providing it
+        # saves SLSQP from approximating it with finite differences, which costs one
+        # Python callback per channel on every iteration.
+        constraint_jacobian = np.ones(len(channels))
+        constraints = {
+            "type": "eq",
+            "fun": lambda x: np.sum(x) - total_budget,
+            "jac": lambda x: constraint_jacobian,
         }
 
-    initial_guess = [total_budget // len(channels)] * len(channels)
+        result = minimize(
+            objective,
+            initial_guess,
+            method="SLSQP",
+            jac=True,
+            bounds=bounds,
+            constraints=constraints,
+            options={"ftol": ftol, "maxiter": maxiter},
+        )
+        optimal_budget = result.x
+
+    elif solver == "projected_gradient":
+        optimal_budget = _projected_gradient_descent(
+            objective,
+            initial_guess,
+            lower,
+            upper,
+            total_budget,
+            ftol=ftol,
+            maxiter=maxiter,
+        )
+
+    else:
+        raise ValueError("`solver` must be either 'SLSQP' or 'projected_gradient'.")
+
+    return {channel: budget for channel, budget in zip(channels, optimal_budget)}
+
+
+def optimize_budget_distribution_batch(
+    method: str,
+    total_budgets: List[float],
+    budget_ranges: Optional[Dict[str, Tuple[float, float]]],
+    parameters: Dict[str, Tuple[float, float]],
+    channels: List[str],
+    ftol: float = 1e-6,
+    maxiter: int = 200,
+) -> DataFrame:
+    """
+    Optimize the budget allocation across channels for several total budgets at once.
+
+    This is equivalent to calling `optimize_budget_distribution` with the projected gradient
+    solver for each of the total budgets, but all the problems are solved simultaneously
+    with vectorized operations, which makes sweeps over the total budget much faster than
+    solving them one by one.
+
+    Parameters
+    ----------
+    total_budgets : List of float
+        The total budgets to be distributed across channels.
+    budget_ranges : Dict or None
+        An optional dictionary defining the minimum and maximum budget for each channel.
+        If not provided, the budget for each channel is constrained between 0 and the smaller
+        of its L value and the total budget.
+    parameters : Dict
+        Michaelis-Menten parameters for each channel as described in `calculate_expected_contribution`.
+    channels : list of str
+        The list of channels for which the budget is being optimized.
+    ftol : float, optional
+        Precision goal for the value of the objective in the stopping criterion, by default 1e-6.
+    maxiter : int, optional
+        Maximum number of iterations, by default 200.
+
+    Returns
+    -------
+    DataFrame
+        A DataFrame indexed by the total budgets, with the optimal budget for each channel as columns.
+    """
+
+    # Check if budget_ranges is the correct type
+    if not isinstance(budget_ranges, (dict, type(None))):
+        raise TypeError("`budget_ranges` should be a dictionary or None.")
 
-    bounds = [budget_ranges[channel] for channel in channels]
+    if np.ndim(total_budgets) != 1:
+        raise ValueError("`total_budgets` should be a one-dimensional list of budgets.")
 
-    constraints = {"type": "eq", "fun": lambda x: np.sum(x) - total_budget}
+    total = np.asarray(total_budgets, dtype=np.float64)
+    lower, upper = _budget_bounds(budget_ranges, parameters, channels, total)
 
-    result = minimize(
-        lambda x: objective_distribution(x, method, channels, parameters),
+    objective = _build_objective(method, channels, parameters)
+    initial_guess = _initial_guess(objective, lower, upper, total)
+    optimal_budgets = _projected_gradient_descent(
+        objective,
         initial_guess,
-        method="SLSQP",
-        bounds=bounds,
-        constraints=constraints,
+        lower,
+        upper,
+        total,
+        ftol=ftol,
+        maxiter=maxiter,
     )
 
-    return {channel: budget for channel, budget in zip(channels, result.x)}
+    return DataFrame(
+        optimal_budgets,
+        index=Index(total, name="total_budget"),
+        columns=channels,
+    )
 
 
 def budget_allocator(
@@ -193,6 +683,9 @@ def budget_allocator(
     channels: List[str],
     parameters: Dict[str, Tuple[float, float]],
     budget_ranges: Optional[Dict[str, Tuple[float, float]]],
+    solver: str = "SLSQP",
+    ftol: float = 1e-6,
+    maxiter: int = 200,
 ) -> DataFrame:
     optimal_budget = optimize_budget_distribution(
         method=method,
@@ -200,6 +693,9 @@ def budget_allocator(
         budget_ranges=budget_ranges,
         parameters=parameters,
         channels=channels,
+        solver=solver,
+        ftol=ftol,
+        maxiter=maxiter,
     )
 
     expected_contribution = calculate_expected_contribution(
@@ -214,3 +710,47 @@ def budget_allocator(
             "optimal_budget": optimal_budget,
         }
     )
+
+
+def budget_allocator_batch(
+    method: str,
+    total_budgets: List[float],
+    channels: List[str],
+    parameters: Dict[str, Tuple[float, float]],
+    budget_ranges: Optional[Dict[str, Tuple[float, float]]],
+    ftol: float = 1e-6,
+    maxiter: int = 200,
+) -> DataFrame:
+    """
+    Batched counterpart of `budget_allocator`, optimizing several total budgets at once.
+
+    The result is indexed by the total budget and then by the channels and 'total', so that
+    selecting one total budget gives the same table as `budget_allocator`. The expected
+    contributions of all the total budgets are computed in a single vectorized call.
+    """
+    optimal_budgets = optimize_budget_distribution_batch(
+        method=method,
+        total_budgets=total_budgets,
+        budget_ranges=budget_ranges,
+        parameters=parameters,
+        channels=channels,
+        ftol=ftol,
+        maxiter=maxiter,
+    )
+
+    budgets = optimal_budgets.to_numpy()
+    contributions = _get_response_function(method, _RESPONSE_FUNCTIONS)(
+        budgets, *_stack_parameters(channels, parameters)
+    )
+
+    return DataFrame(
+        {
+            "estimated_contribution": np.column_stack(
+                [contributions, contributions.sum(axis=-1)]
+            ).ravel(),
+            "optimal_budget": np.column_stack([budgets, budgets.sum(axis=-1)]).ravel(),
+        },
+        index=MultiIndex.from_product(
+            [optimal_budgets.index, [*channels, "total"]], names=["total_budget", None]
+        ),
+    )
@@ -2,7 +2,7 @@
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import arviz as az
 import matplotlib.pyplot as plt
@@ -10,6 +10,8 @@ import numpy as np
 import numpy.typing as npt
 import pandas as pd
 import pymc as pm
+import pytensor
+import pytensor.tensor as pt
 import seaborn as sns
 from pytensor.tensor import TensorVariable
 from xarray import DataArray, Dataset
@@ -20,7 +22,11 @@ from pymc_marketing.mmm.lift_test import (
     scale_lift_measurements,
 )
 from pymc_marketing.mmm.preprocessing import MaxAbsScaleChannels, MaxAbsScaleTarget
-from pymc_marketing.mmm.transformers import geometric_adstock, logistic_saturation
+from pymc_marketing.mmm.transformers import (
+    geometric_adstock,
+    geometric_adstock_recursive,
+    logistic_saturation,
+)
 from pymc_marketing.mmm.utils import (
     apply_sklearn_transformer_across_dim,
     create_new_spend_data,
@@ -82,6 +88,11 @@ class BaseDelayedSaturatedMMM(MMM):
         self.yearly_seasonality = yearly_seasonality
         self.date_column = date_column
         self.validate_data = validate_data
+        self._channel_contributions_forward_pass_cache: Optional[
+            Tuple[
+                Dataset, str, Callable[[npt.NDArray[np.float_]], npt.NDArray[np.float_]]
+            ]
+        ] = None
 
         super().__init__(
             date_column=date_column,
@@ -515,17 +526,54 @@ class BaseDelayedSaturatedMMM(MMM):
         array-like
             Transformed channel data.
         """
-        alpha_posterior = self.fit_result["alpha"].to_numpy()
+        channel_contributions_forward_pass = (
+            self._channel_contributions_forward_pass_function()
+        )
+        return channel_contributions_forward_pass(
+            np.asarray(channel_data, dtype=pytensor.config.floatX)
+        )
 
-        lam_posterior = self.fit_result["lam"].to_numpy()
+    def _channel_contributions_forward_pass_function(
+        self,
+    ) -> Callable[[npt.NDArray[np.float_]], npt.NDArray[np.float_]]:
+        """Compile the forward pass of the channel contributions as a function of the channel data.
+
+        The compiled function is cached for the current posterior and `pytensor.config.floatX`, so
+        that repeated forward passes, e.g. over a grid of channel data, do not rebuild and compile
+        the graph on every call. The posterior samples are cast to `floatX`, so that setting it to
+        ``"float32"`` runs the whole forward pass in single precision.
+
+        Returns
+        -------
+        Callable
+            Compiled forward pass, mapping the channel data to the channel contributions.
+        """
+        posterior = self.fit_result
+        if (
+            self._channel_contributions_forward_pass_cache is not None
+            and self._channel_contributions_forward_pass_cache[0] is posterior
+            and self._channel_contributions_forward_pass_cache[1]
+            == pytensor.config.floatX
+        ):
+            return self._channel_contributions_forward_pass_cache[2]
+
+        alpha_posterior = np.asarray(posterior["alpha"], dtype=pytensor.config.floatX)
+
+        lam_posterior = np.asarray(posterior["lam"], dtype=pytensor.config.floatX)
         lam_posterior_expanded = np.expand_dims(a=lam_posterior, axis=2)
 
-        beta_channel_posterior = self.fit_result["beta_channel"].to_numpy()
+        beta_channel_posterior = np.asarray(
+            posterior["beta_channel"], dtype=pytensor.config.floatX
+        )
         beta_channel_posterior_expanded = np.expand_dims(
             a=beta_channel_posterior, axis=2
         )
 
-        geometric_adstock_posterior = geometric_adstock(
+        channel_data = pt.matrix("channel_data")
+
+        # The recursive form gives the same adstock as the model, but its cost does not
+        # grow with the maximum lag, which matters when evaluating all posterior samples
+        geometric_adstock_posterior = geometric_adstock_recursive(
             x=channel_data,
             alpha=alpha_posterior,
             l_max=self.adstock_max_lag,
@@ -541,7 +589,15 @@ class BaseDelayedSaturatedMMM(MMM):
         channel_contribution_forward_pass = (
             beta_channel_posterior_expanded * logistic_saturation_posterior
         )
-        return channel_contribution_forward_pass.eval()
+        channel_contributions_forward_pass_function = pytensor.function(
+            [channel_data], channel_contribution_forward_pass
+        )
+        self._channel_contributions_forward_pass_cache = (
+            posterior,
+            pytensor.config.floatX,
+            channel_contributions_forward_pass_function,
+        )
+        return channel_contributions_forward_pass_function
 
     @property
     def _serializable_model_config(self) -> Dict[str, Any]:
@@ -861,12 +917,11 @@ class DelayedSaturatedMMM(
         channel_contribution_forward_pass = super().channel_contributions_forward_pass(
             channel_data=channel_data
         )
-        target_transformed_vectorized = np.vectorize(
-            self.target_transformer.inverse_transform,
-            excluded=[1, 2],
-            signature="(m, n) -> (m, n)",
-        )
-        return target_transformed_vectorized(channel_contribution_forward_pass)
+        # The target transformer is fitted on a single column, so all the draws are
+        # transformed at once as one column instead of looping over chains and draws.
+        return self.target_transformer.inverse_transform(
+            channel_contribution_forward_pass.reshape(-1, 1)
+        ).reshape(channel_contribution_forward_pass.shape)
 
     def get_channel_contributions_forward_pass_grid(
         self, start: float, stop: float, num: int
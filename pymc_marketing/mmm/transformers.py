@@ -6,6 +6,7 @@ from typing import Any, NamedTuple, Union
 import numpy as np
 import numpy.typing as npt
 import pymc as pm
+import pytensor
 import pytensor.tensor as pt
 from pytensor.tensor.random.utils import params_broadcast_shapes
 
@@ -201,11 +202,71 @@ def geometric_adstock(
        with carryover and shape effects." (2017).
     """
 
-    w = pt.power(pt.as_tensor(alpha)[..., None], pt.arange(l_max, dtype=x.dtype))
+    w = pt.power(pt.as_tensor(alpha)[..., None], np.arange(l_max, dtype=x.dtype))
     w = w / pt.sum(w, axis=-1, keepdims=True) if normalize else w
     return batched_convolution(x, w, axis=axis, mode=ConvMode.After)
 
 
+def geometric_adstock_recursive(
+    x, alpha: float = 0.0, l_max: int = 12, normalize: bool = False, axis: int = 0
+):
+    R"""Geometric adstock transformation computed with a recursion over time.
+
+    Equivalent to `geometric_adstock`, but instead of convolving with the `l_max`
+    weights it uses the recursion
+
+    .. math::
+
+        y_t = x_t + \alpha y_{t-1} - \alpha^{l_{max}} x_{t - l_{max}},
+
+    where the last term drops the spend that falls out of the carryover window.
+    Each time step costs a constant amount of work regardless of `l_max`, which
+    makes it faster to evaluate on large batches of parameters, e.g. over the
+    posterior samples. As the steps are sequential it is slower to differentiate,
+    so `geometric_adstock` remains the choice for building models.
+
+    Parameters
+    ----------
+    x : tensor
+        Input tensor.
+    alpha : float, by default 0.0
+        Retention rate of ad effect. Must be between 0 and 1.
+    l_max : int, by default 12
+        Maximum duration of carryover effect.
+    normalize : bool, by default False
+        Whether to normalize the weights.
+    axis : int, by default 0
+        Time axis of `x`.
+
+    Returns
+    -------
+    tensor
+        Transformed tensor, with the same shape as the output of `geometric_adstock`.
+    """
+    x = pt.as_tensor(x)
+    alpha_tensor = pt.as_tensor(alpha)
+    orig_ndim = x.ndim
+    axis = axis if axis >= 0 else orig_ndim + axis
+    # Move the "time" axis to the front so that scan iterates over it
+    x = pt.moveaxis(x, axis, 0)
+    x_dropped = pt.concatenate([pt.zeros_like(x[:l_max]), x[:-l_max]], axis=0)
+    alpha_l_max = pt.power(alpha_tensor, l_max)
+
+    def step(x_t, x_dropped_t, y_prev):
+        return x_t + alpha_tensor * y_prev - alpha_l_max * x_dropped_t
+
+    y, _ = pytensor.scan(
+        step,
+        sequences=[x, x_dropped],
+        outputs_info=[pt.zeros_like(alpha_tensor * x[0])],
+    )
+    if normalize:
+        w = pt.power(alpha_tensor[..., None], np.arange(l_max, dtype=x.dtype))
+        y = y / pt.sum(w, axis=-1)
+    # Move the "time" axis back to where `geometric_adstock` places it
+    return pt.moveaxis(y, 0, axis + y.ndim - orig_ndim)
+
+
 def delayed_adstock(
     x,
     alpha: float = 0.0,
@@ -272,7 +333,7 @@ def delayed_adstock(
     """
     w = pt.power(
         pt.as_tensor(alpha)[..., None],
-        (pt.arange(l_max, dtype=x.dtype) - pt.as_tensor(theta)[..., None]) ** 2,
+        (np.arange(l_max, dtype=x.dtype) - pt.as_tensor(theta)[..., None]) ** 2,
     )
     w = w / pt.sum(w, axis=-1, keepdims=True) if normalize else w
     return batched_convolution(x, w, axis=axis, mode=ConvMode.After)
@@ -359,7 +420,7 @@ def weibull_adstock(
     """
     lam = pt.as_tensor(lam)[..., None]
     k = pt.as_tensor(k)[..., None]
-    t = pt.arange(l_max, dtype=x.dtype) + 1
+    t = np.arange(l_max, dtype=x.dtype) + 1
 
     if type == WeibullType.PDF:
         w = pt.exp(pm.Weibull.logp(t, k, lam))
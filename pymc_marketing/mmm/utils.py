@@ -294,7 +294,7 @@ def sigmoid_saturation(
         lam makes the curve steeper, while a lower value makes it more gradual.
     """
 
-    if alpha <= 0 or lam <= 0:
+    if np.any(alpha <= 0) or np.any(lam <= 0):
         raise ValueError("alpha and lam must be greater than 0")
 
     return (alpha - alpha * np.exp(-lam * x)) / (1 + np.exp(-lam * x))
@@ -1,9 +1,21 @@
+import warnings
+
+import numpy as np
 import pytest
+from scipy.optimize import approx_fprime, minimize
 
 from pymc_marketing.mmm.budget_optimizer import (
+    _budget_bounds,
+    _build_objective,
+    _initial_guess,
+    _project_onto_capped_simplex,
+    _projected_gradient_descent,
+    budget_allocator,
+    budget_allocator_batch,
     calculate_expected_contribution,
     objective_distribution,
     optimize_budget_distribution,
+    optimize_budget_distribution_batch,
 )
 
 
@@ -17,6 +29,8 @@ from pymc_marketing.mmm.budget_optimizer import (
             {"channel1": 5, "channel2": 10},
             {"channel1": 5.0, "channel2": 10.0, "total": 15.0},
         ),
+        ("michaelis-menten", {}, {}, {"total": 0.0}),
+        ("sigmoid", {}, {}, {"total": 0.0}),
         # Add more cases
     ],
 )
@@ -24,6 +38,24 @@ def test_calculate_expected_contribution(method, parameters, budget, expected):
     assert calculate_expected_contribution(method, parameters, budget) == expected
 
 
+# Testing Calculate Expected Contribution against rounded values
+@pytest.mark.parametrize(
+    "method,parameters,budget,expected",
+    [
+        (
+            "sigmoid",
+            {"channel1": (1, 0.5), "channel2": (2, 1.0)},
+            {"channel1": 1, "channel2": 2},
+            {"channel1": 0.2449, "channel2": 1.5232, "total": 1.7681},
+        ),
+    ],
+)
+def test_calculate_expected_contribution_approx(method, parameters, budget, expected):
+    assert calculate_expected_contribution(method, parameters, budget) == pytest.approx(
+        expected, 0.001
+    )
+
+
 # Testing invalid method for Calculate Expected Contribution
 def test_calculate_expected_contribution_invalid_method():
     with pytest.raises(ValueError):
@@ -50,6 +82,8 @@ def test_calculate_expected_contribution_invalid_method():
             {"channel1": (1, 0.5), "channel2": (1, 0.5)},
             -0.707,
         ),
+        ([], "michaelis-menten", [], {}, 0.0),
+        ([], "sigmoid", [], {}, 0.0),
         # Add more cases
     ],
 )
@@ -70,6 +104,88 @@ def test_objective_distribution_invalid_method():
         )
 
 
+# Testing that the prebuilt objective matches Objective Distribution
+@pytest.mark.parametrize(
+    "x,method,channels,parameters",
+    [
+        (
+            [5, 10],
+            "michaelis-menten",
+            ["channel1", "channel2"],
+            {"channel1": (10, 5), "channel2": (20, 10)},
+        ),
+        (
+            [1, 2],
+            "sigmoid",
+            ["channel1", "channel2"],
+            {"channel1": (1, 0.5), "channel2": (1, 0.5)},
+        ),
+    ],
+)
+def test_build_objective(x, method, channels, parameters):
+    objective = _build_objective(method, channels, parameters)
+    value, _ = objective(x)
+    assert value == pytest.approx(
+        objective_distribution(x, method, channels, parameters)
+    )
+
+
+# Testing prebuilt objective with invalid method
+def test_build_objective_invalid_method():
+    with pytest.raises(ValueError):
+        _build_objective(
+            "invalid",
+            ["channel1", "channel2"],
+            {"channel1": (10, 5), "channel2": (20, 10)},
+        )
+
+
+# Testing that the prebuilt objective validates the sigmoid parameters only
+def test_build_objective_invalid_sigmoid_parameters():
+    with pytest.raises(ValueError, match="greater than 0"):
+        _build_objective(
+            "sigmoid",
+            ["channel1", "channel2"],
+            {"channel1": (1, 0.5), "channel2": (2, 0)},
+        )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        _build_objective(
+            "michaelis-menten",
+            ["channel1", "channel2"],
+            {"channel1": (10, 0), "channel2": (20, 10)},
+        )
+
+
+# Testing the analytic gradient against finite differences
+@pytest.mark.parametrize(
+    "x,method,channels,parameters",
+    [
+        (
+            [5.0, 10.0],
+            "michaelis-menten",
+            ["channel1", "channel2"],
+            {"channel1": (10, 5), "channel2": (20, 10)},
+        ),
+        (
+            [1.0, 2.0],
+            "sigmoid",
+            ["channel1", "channel2"],
+            {"channel1": (1, 0.5), "channel2": (2, 1.5)},
+        ),
+    ],
+)
+def test_build_objective_gradient(x, method, channels, parameters):
+    objective = _build_objective(method, channels, parameters)
+    _, gradient = objective(x)
+    np.testing.assert_allclose(
+        gradient,
+        approx_fprime(np.array(x), lambda x: objective(x)[0], 1e-7),
+        rtol=1e-4,
+    )
+
+
 # Testing optimize_budget_distribution with valid inputs
 @pytest.mark.parametrize(
     "method,total_budget,budget_ranges,parameters,channels,expected_sum",
@@ -109,3 +225,273 @@ def test_optimize_budget_distribution_valid(
                 <= result[channel]
                 <= budget_ranges[channel][1]
             )
+
+
+# Testing the projection onto the budgets within bounds adding up to the total
+@pytest.mark.parametrize(
+    "y,lower,upper,total,expected",
+    [
+        ([1.0, 2.0, 3.0], [0, 0, 0], [10, 10, 10], 3.0, [0.0, 1.0, 2.0]),
+        ([1.0, 2.0, 3.0], [0, 0, 0], [1, 1, 1], 2.0, [0.0, 1.0, 1.0]),
+        ([5.0, 5.0], [0, 0], [1, 1], 10.0, [1.0, 1.0]),
+    ],
+)
+def test_project_onto_capped_simplex(y, lower, upper, total, expected):
+    projection = _project_onto_capped_simplex(
+        np.array(y), np.array(lower, float), np.array(upper, float), total
+    )
+    np.testing.assert_allclose(projection, expected)
+
+
+# Testing that both solvers find the same optimal budget distribution
+@pytest.mark.parametrize(
+    "method,total_budget,budget_ranges,parameters,channels",
+    [
+        (
+            "michaelis-menten",
+            100,
+            {"channel1": (0, 80), "channel2": (0, 80), "channel3": (0, 80)},
+            {"channel1": (10, 5), "channel2": (20, 10), "channel3": (50, 40)},
+            ["channel1", "channel2", "channel3"],
+        ),
+        (
+            "sigmoid",
+            10,
+            {"channel1": (0, 8), "channel2": (0, 8)},
+            {"channel1": (1, 0.5), "channel2": (3, 0.2)},
+            ["channel1", "channel2"],
+        ),
+    ],
+)
+def test_optimize_budget_distribution_solvers_agree(
+    method, total_budget, budget_ranges, parameters, channels
+):
+    slsqp = optimize_budget_distribution(
+        method,
+        total_budget,
+        budget_ranges,
+        parameters,
+        channels,
+        solver="SLSQP",
+        ftol=1e-9,
+    )
+    projected_gradient = optimize_budget_distribution(
+        method,
+        total_budget,
+        budget_ranges,
+        parameters,
+        channels,
+        solver="projected_gradient",
+        ftol=1e-9,
+    )
+    assert sum(projected_gradient.values()) == pytest.approx(total_budget)
+    for channel in channels:
+        assert projected_gradient[channel] == pytest.approx(slsqp[channel], rel=1e-3)
+
+
+# Testing optimize_budget_distribution with invalid solver
+def test_optimize_budget_distribution_invalid_solver():
+    with pytest.raises(ValueError):
+        optimize_budget_distribution(
+            "michaelis-menten",
+            100,
+            None,
+            {"channel1": (10, 5), "channel2": (20, 10)},
+            ["channel1", "channel2"],
+            solver="invalid",
+        )
+
+
+# Testing that the iteration limit is forwarded to both solvers
+@pytest.mark.parametrize("solver", ["SLSQP", "projected_gradient"])
+def test_optimize_budget_distribution_maxiter(solver):
+    parameters = {"channel1": (10, 5), "channel2": (20, 10), "channel3": (50, 40)}
+    channels = ["channel1", "channel2", "channel3"]
+    budget_ranges = {channel: (0, 80) for channel in channels}
+    one_iteration = optimize_budget_distribution(
+        "michaelis-menten",
+        100,
+        budget_ranges,
+        parameters,
+        channels,
+        solver=solver,
+        maxiter=1,
+    )
+    converged = optimize_budget_distribution(
+        "michaelis-menten",
+        100,
+        budget_ranges,
+        parameters,
+        channels,
+        solver=solver,
+        ftol=1e-9,
+    )
+    assert one_iteration != pytest.approx(converged, rel=1e-3)
+
+
+# Testing that SLSQP is given the Jacobian of the budget constraint
+def test_optimize_budget_distribution_constraint_jacobian(monkeypatch):
+    minimize_kwargs = {}
+
+    def spy_minimize(*args, **kwargs):
+        minimize_kwargs.update(kwargs)
+        return minimize(*args, **kwargs)
+
+    monkeypatch.setattr("pymc_marketing.mmm.budget_optimizer.minimize", spy_minimize)
+    optimize_budget_distribution(
+        "michaelis-menten",
+        100,
+        None,
+        {"channel1": (10, 5), "channel2": (20, 10), "channel3": (50, 40)},
+        ["channel1", "channel2", "channel3"],
+    )
+    np.testing.assert_array_equal(
+        minimize_kwargs["constraints"]["jac"](np.zeros(3)), np.ones(3)
+    )
+
+
+# Testing the projection of several budget distributions at once
+def test_project_onto_capped_simplex_batch():
+    y = np.array([[1.0, 2.0, 3.0], [1.0, 2.0, 3.0], [5.0, 5.0, 5.0]])
+    lower, upper = np.zeros(3), np.ones(3)
+    total = np.array([1.0, 2.0, 10.0])
+    projection = _project_onto_capped_simplex(y, lower, upper, total)
+    for i in range(len(y)):
+        np.testing.assert_allclose(
+            projection[i], _project_onto_capped_simplex(y[i], lower, upper, total[i])
+        )
+
+
+# Testing that the single and batched projected gradient descents agree
+@pytest.mark.parametrize(
+    "method,parameters,upper",
+    [
+        (
+            "michaelis-menten",
+            {"channel1": (10, 5), "channel2": (20, 10), "channel3": (50, 40)},
+            [80.0, 80.0, 80.0],
+        ),
+        (
+            "sigmoid",
+            {"channel1": (4, 0.5), "channel2": (3, 0.2), "channel3": (1, 1.0)},
+            [4.0, 10.0, 2.0],
+        ),
+    ],
+)
+def test_projected_gradient_descent_batch(method, parameters, upper):
+    channels = list(parameters)
+    objective = _build_objective(method, channels, parameters)
+    lower, upper = np.zeros(3), np.array(upper)
+    total = np.array([1.0, 5.0, 10.0, 15.0])
+    x0 = np.repeat(total[:, None] / 3, 3, axis=1)
+    optimal_budgets = _projected_gradient_descent(objective, x0, lower, upper, total)
+    for i in range(len(total)):
+        np.testing.assert_allclose(
+            optimal_budgets[i],
+            _projected_gradient_descent(objective, x0[i], lower, upper, total[i]),
+        )
+
+
+# Testing optimize_budget_distribution_batch against one optimization per total budget
+@pytest.mark.parametrize(
+    "method,total_budgets,budget_ranges,parameters,channels",
+    [
+        (
+            "michaelis-menten",
+            [50, 100, 150],
+            {"channel1": (0, 80), "channel2": (0, 80), "channel3": (0, 80)},
+            {"channel1": (10, 5), "channel2": (20, 10), "channel3": (50, 40)},
+            ["channel1", "channel2", "channel3"],
+        ),
+        (
+            "sigmoid",
+            [1, 5, 10],
+            None,
+            {"channel1": (4, 0.5), "channel2": (3, 0.2)},
+            ["channel1", "channel2"],
+        ),
+    ],
+)
+def test_optimize_budget_distribution_batch(
+    method, total_budgets, budget_ranges, parameters, channels
+):
+    result = optimize_budget_distribution_batch(
+        method, total_budgets, budget_ranges, parameters, channels
+    )
+    assert list(result.index) == total_budgets
+    assert list(result.columns) == channels
+    for total_budget in total_budgets:
+        expected = optimize_budget_distribution(
+            method,
+            total_budget,
+            budget_ranges,
+            parameters,
+            channels,
+            solver="projected_gradient",
+        )
+        assert result.loc[total_budget].to_dict() == pytest.approx(expected)
+
+
+# Testing that budget_allocator_batch matches budget_allocator for each total budget
+def test_budget_allocator_batch():
+    parameters = {"channel1": (10, 5), "channel2": (20, 10), "channel3": (50, 40)}
+    channels = ["channel1", "channel2", "channel3"]
+    result = budget_allocator_batch(
+        "michaelis-menten", [50, 100], channels, parameters, None
+    )
+    assert list(result.columns) == ["estimated_contribution", "optimal_budget"]
+    for total_budget in [50, 100]:
+        expected = budget_allocator(
+            "michaelis-menten",
+            total_budget,
+            channels,
+            parameters,
+            None,
+            solver="projected_gradient",
+        )
+        allocation = result.loc[total_budget]
+        assert list(allocation.index) == list(expected.index)
+        np.testing.assert_allclose(allocation.to_numpy(), expected.to_numpy())
+
+
+# Testing optimize_budget_distribution_batch with a scalar total budget
+def test_optimize_budget_distribution_batch_scalar_total_budget():
+    with pytest.raises(ValueError, match="one-dimensional"):
+        optimize_budget_distribution_batch(
+            "michaelis-menten",
+            100,
+            None,
+            {"channel1": (10, 5), "channel2": (20, 10)},
+            ["channel1", "channel2"],
+        )
+
+
+# Testing that the default bounds are the same for one and several total budgets
+def test_budget_bounds_default():
+    parameters = {"channel1": (10, 5), "channel2": (20, 10)}
+    channels = ["channel1", "channel2"]
+    lower, upper = _budget_bounds(None, parameters, channels, 15)
+    np.testing.assert_array_equal(lower, [0, 0])
+    np.testing.assert_array_equal(upper, [10, 15])
+
+    lowers, uppers = _budget_bounds(None, parameters, channels, np.array([15, 30]))
+    np.testing.assert_array_equal(lowers[0], lower)
+    np.testing.assert_array_equal(uppers, [[10, 15], [10, 20]])
+
+
+# Testing that the initial guess is feasible and favors the highest marginal contribution
+def test_initial_guess():
+    objective = _build_objective(
+        "michaelis-menten",
+        ["channel1", "channel2", "channel3"],
+        {"channel1": (10, 5), "channel2": (20, 10), "channel3": (50, 40)},
+    )
+    lower, upper = np.zeros(3), np.full(3, 50.0)
+    initial_guess = _initial_guess(objective, lower, upper, 100)
+    assert initial_guess.sum() == pytest.approx(100)
+    assert np.all((lower <= initial_guess) & (initial_guess <= upper))
+    assert np.argmax(initial_guess) == np.argmax(-objective(np.full(3, 100 / 3))[1])
+
+    initial_guesses = _initial_guess(objective, lower, upper, np.array([30, 100]))
+    np.testing.assert_allclose(initial_guesses[1], initial_guess)
+    assert initial_guesses[0].sum() == pytest.approx(30)
@@ -5,6 +5,7 @@ import arviz as az
 import numpy as np
 import pandas as pd
 import pymc as pm
+import pytensor
 import pytest
 import xarray as xr
 from matplotlib import pyplot as plt
@@ -421,6 +422,65 @@ class TestDelayedSaturatedMMM:
             >= channel_contributions_forward_pass
         ).all()
 
+    def test_channel_contributions_forward_pass_function_is_cached(
+        self, mmm_fitted: DelayedSaturatedMMM
+    ) -> None:
+        forward_pass_function = (
+            mmm_fitted._channel_contributions_forward_pass_function()
+        )
+        assert (
+            mmm_fitted._channel_contributions_forward_pass_function()
+            is forward_pass_function
+        )
+
+    def test_optimize_channel_budget_for_maximum_contribution_batch(
+        self, mmm_fitted: DelayedSaturatedMMM
+    ) -> None:
+        parameters = {"channel_1": (10, 5), "channel_2": (20, 10)}
+        with pytest.warns(UserWarning, match="experimental"):
+            result = mmm_fitted.optimize_channel_budget_for_maximum_contribution_batch(
+                "michaelis-menten", [10, 20], parameters=parameters
+            )
+        assert list(result.index.levels[0]) == [10, 20]
+        assert list(result.columns) == ["estimated_contribution", "optimal_budget"]
+        for total_budget in [10, 20]:
+            allocation = result.loc[total_budget]
+            assert list(allocation.index) == [*mmm_fitted.channel_columns, "total"]
+            assert allocation.loc["total", "optimal_budget"] == pytest.approx(
+                total_budget
+            )
+
+        with pytest.raises(ValueError):
+            mmm_fitted.optimize_channel_budget_for_maximum_contribution_batch(
+                "michaelis-menten", [10, "20"], parameters=parameters
+            )
+
+        with pytest.raises(ValueError, match="one-dimensional"):
+            mmm_fitted.optimize_channel_budget_for_maximum_contribution_batch(
+                "michaelis-menten", 100, parameters=parameters
+            )
+
+    def test_channel_contributions_forward_pass_float32(
+        self, mmm_fitted: DelayedSaturatedMMM
+    ) -> None:
+        channel_data = mmm_fitted.preprocessed_data["X"][
+            mmm_fitted.channel_columns
+        ].to_numpy()
+        channel_contributions_forward_pass = (
+            mmm_fitted.channel_contributions_forward_pass(channel_data=channel_data)
+        )
+        with pytensor.config.change_flags(floatX="float32"):
+            channel_contributions_forward_pass_float32 = (
+                mmm_fitted.channel_contributions_forward_pass(channel_data=channel_data)
+            )
+        assert channel_contributions_forward_pass_float32.dtype == np.float32
+        np.testing.assert_allclose(
+            actual=channel_contributions_forward_pass_float32,
+            desired=channel_contributions_forward_pass,
+            rtol=1e-5,
+            atol=1e-6,
+        )
+
     def test_get_channel_contributions_forward_pass_grid_shapes(
         self, mmm_fitted: DelayedSaturatedMMM
     ) -> None:
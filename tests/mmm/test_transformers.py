@@ -14,6 +14,7 @@ from pymc_marketing.mmm.transformers import (
     batched_convolution,
     delayed_adstock,
     geometric_adstock,
+    geometric_adstock_recursive,
     logistic_saturation,
     michaelis_menten,
     tanh_saturation,
@@ -154,6 +155,31 @@ class TestsAdstockTransformers:
         assert y.shape == x.shape
         np.testing.assert_almost_equal(actual=y, desired=ys, decimal=12)
 
+    @pytest.mark.parametrize(
+        "alpha, axis",
+        [
+            (0.5, 0),
+            (np.array([0.9, 0.33, 0.5, 0.1, 0.0]), 0),
+            (np.random.default_rng(42).uniform(size=(3, 2, 5)), 0),
+            (np.array([0.9, 0.33, 0.5, 0.1, 0.0])[:, None], 1),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "l_max, normalize", [(1, False), (12, False), (12, True), (150, True)]
+    )
+    def test_geometric_adstock_recursive(
+        self, dummy_design_matrix, alpha, axis, l_max, normalize
+    ):
+        x = dummy_design_matrix if axis == 0 else dummy_design_matrix.T
+        y = geometric_adstock_recursive(
+            x=x, alpha=alpha, l_max=l_max, normalize=normalize, axis=axis
+        ).eval()
+        expected = geometric_adstock(
+            x=x, alpha=alpha, l_max=l_max, normalize=normalize, axis=axis
+        ).eval()
+        assert y.shape == expected.shape
+        np.testing.assert_almost_equal(actual=y, desired=expected, decimal=12)
+
     def test_delayed_adstock_vectorized(self, dummy_design_matrix):
         x = dummy_design_matrix
         x_tensor = pt.as_tensor_variable(x)
@@ -259,6 +285,28 @@ class TestsAdstockTransformers:
         with expectation:
             weibull_adstock(x=np.ones(shape=(100)), lam=0.5, k=0.5, l_max=10, type=type)
 
+    @pytest.mark.parametrize(
+        "adstock, kwargs",
+        [
+            (geometric_adstock, {"alpha": pt.scalar("alpha")}),
+            (
+                delayed_adstock,
+                {"alpha": pt.scalar("alpha"), "theta": pt.scalar("theta")},
+            ),
+            (weibull_adstock, {"lam": pt.scalar("lam"), "k": pt.scalar("k")}),
+        ],
+    )
+    def test_adstock_symbolic_parameters(self, adstock, kwargs):
+        x = pt.vector("x")
+        y = adstock(x, l_max=4, **kwargs)
+        fn = pytensor.function([x, *kwargs.values()], y)
+        out = fn(np.ones(10), *(0.5 for _ in kwargs))
+        assert out.shape == (10,)
+        np.testing.assert_allclose(
+            out,
+            adstock(np.ones(10), l_max=4, **{name: 0.5 for name in kwargs}).eval(),
+        )
+
 
 class TestSaturationTransformers:
     def test_logistic_saturation_lam_zero(self):
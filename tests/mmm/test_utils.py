@@ -234,10 +234,11 @@ def test_apply_sklearn_function_across_dim_error(
     [
         (0, 1, 1, 0),
         (1, 1, 1, 0.4621),
+        (np.array([0, 1]), np.array([1, 1]), np.array([1, 1]), np.array([0, 0.4621])),
     ],
 )
 def test_sigmoid_saturation(x, alpha, lam, expected):
-    assert np.isclose(sigmoid_saturation(x, alpha, lam), expected, atol=0.01)
+    assert np.isclose(sigmoid_saturation(x, alpha, lam), expected, atol=0.01).all()
 
 
 @pytest.mark.parametrize(
@@ -246,6 +247,7 @@ def test_sigmoid_saturation(x, alpha, lam, expected):
         (0, 0, 1),
         (1, -1, 1),
         (1, 1, 0),
+        (np.array([1, 1]), np.array([1, -1]), np.array([1, 1])),
     ],
 )
 def test_sigmoid_saturation_value_errors(x, alpha, lam):